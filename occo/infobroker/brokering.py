@@ -42,3 +42,45 @@ class RandomDefinitionSelector(NodeDefinitionSelector):
                   len(definition_list))
         import random
         return random.choice(definition_list)
+
+@factory.register(NodeDefinitionSelector, 'fastest')
+class FastestDefinitionSelector(NodeDefinitionSelector):
+    """
+    Prefers the backend expected to deliver a node the soonest, based on the
+    provisioning latency and failure rate observed on each backend (see
+    ``backends.provisioning_stats``).
+
+    The expected delivery time of a backend is its average latency, scaled
+    by the expected number of attempts (``1 / (1 - failure_rate)``).
+    Backends without observations are preferred, so each of them gets
+    sampled. Ties are broken randomly.
+    """
+    def __init__(self, **kwargs):
+        self.ib = ib.main_info_broker
+
+    @staticmethod
+    def expected_delivery_time(stats):
+        if stats is None:
+            return 0
+        if stats['latency'] is None or stats['failure_rate'] >= 1:
+            return float('inf')
+        return stats['latency'] / (1 - stats['failure_rate'])
+
+    def select_definition(self, definition_list):
+        """
+        Selects the implementation whose backend is expected to deliver a
+        node the soonest.
+        """
+        import random
+        endpoint = lambda definition: definition['resource'].get('endpoint')
+        stats = self.ib.get('backends.provisioning_stats',
+                            list(set(endpoint(i) for i in definition_list)))
+        expected = dict((k, self.expected_delivery_time(v))
+                        for k, v in stats.items())
+        best = min(expected.values())
+        candidates = [i for i in definition_list
+                      if expected[endpoint(i)] == best]
+        log.debug('Choosing one of %d definitions (of %d) with expected '
+                  'delivery time %r', len(candidates), len(definition_list),
+                  best)
+        return random.choice(candidates)
@@ -79,6 +79,7 @@ class EventLog(factory.MultiBackend):
             timestamp = int(self._create_timestamp())
         notifier = BaseNotifier().create(main_uds.get_infrastructure_notification(infra_id))
         notifier.send(event_name, timestamp, eventobj)
+        main_uds.record_provisioning_event(event_name, timestamp, eventobj)
         return self._raw_log_event(infra_id, event_name, timestamp, eventobj)
 
     def _create_timestamp(self):
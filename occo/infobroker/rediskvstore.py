@@ -22,7 +22,7 @@ Redis_ implementation of the OCCO
 
 """
 
-__all__ = ['RedisKVStore']
+__all__ = ['RedisKVStore', 'ShardedRedisKVStore']
 
 import occo.infobroker.kvstore as kvs
 import occo.exceptions as exc
@@ -31,6 +31,10 @@ import occo.util as util
 from ruamel import yaml
 import logging
 import redis
+import hashlib
+import bisect
+import itertools
+import time
 
 log = logging.getLogger('occo.infobroker.kvstore.redis')
 
@@ -61,7 +65,7 @@ class RedisConnectionPools:
         return pools[rcd]
 
 class DBSelectorKey(object):
-    def __init__(self, key, kvstore):
+    def __init__(self, key, kvstore, readonly=False):
         dbname, newkey = self.splitkey(key)
         if dbname in kvstore.altdbs:
             self.db = kvstore.altdbs[dbname]
@@ -69,7 +73,8 @@ class DBSelectorKey(object):
         else:
             self.db = kvstore.default_db
             self.key = key
-        self.rcd = RedisConnectionData(kvstore.host, kvstore.port, self.db)
+        host, port = kvstore.select_server(self.key, readonly)
+        self.rcd = RedisConnectionData(host, port, self.db)
 
     def splitkey(self, key):
         parts = key.split(':', 1)
@@ -101,10 +106,22 @@ class RedisKVStore(kvs.KeyValueStore):
     :param deserialize: Deserialization function. Used to convert stored data
         to run-time objects.
     :type deserialize: :class:`str` -> :class:`object`
+    :param list replicas: Replicas of the server, each a :class:`dict` with
+        ``host`` and (optionally) ``port``. Read-only operations are
+        distributed over the replicas.
+    :param float read_your_writes_window: Reads are served by the primary
+        server for this many seconds after a write through this object.
+    :param int max_replica_lag: A replica is not used while its replication
+        offset lags behind the primary's by more than this many bytes, or
+        while its link to the primary is down.
+    :param float lag_check_interval: The replication state of a replica is
+        checked at most this often (seconds).
 
     """
     def __init__(self, host='localhost', port='6379', db=0, altdbs=None,
                  serialize=yaml.dump, deserialize=yaml.load,
+                 replicas=None, read_your_writes_window=1.0,
+                 max_replica_lag=65536, lag_check_interval=1.0,
                  **kwargs):
         super(RedisKVStore, self).__init__(**kwargs)
         self.host, self.port, self.default_db = host, port, db
@@ -115,9 +132,79 @@ class RedisKVStore(kvs.KeyValueStore):
                                          self.altdbs)
         self.serialize = serialize
         self.deserialize = deserialize
+        self.replicas = [(r['host'], r.get('port', '6379'))
+                         for r in util.coalesce(replicas, list())]
+        self.read_your_writes_window = read_your_writes_window
+        self.max_replica_lag = max_replica_lag
+        self.lag_check_interval = lag_check_interval
+        self.replica_status = dict()
+        self.replica_counter = itertools.count()
+        self.last_write = 0
 
-    def transform_key(self, key):
-        tkey = DBSelectorKey(key, self)
+    def select_server(self, key, readonly=False):
+        """
+        Selects the server to be used for accessing the given key.
+
+        Read-only operations are served by a replica, if there is one in
+        sync, and there has been no write through this object in the last
+        ``read_your_writes_window`` seconds.
+
+        :param str key: The key, without its alternative database prefix.
+        :param bool readonly: Whether the key is only going to be read.
+        :returns: ``(host, port)``
+        """
+        primary = self.host, self.port
+        if not readonly or not self.replicas \
+                or time.time() - self.last_write < self.read_your_writes_window:
+            return primary
+        usable = [r for r in self.replicas if self.replica_usable(r)]
+        if not usable:
+            return primary
+        return usable[next(self.replica_counter) % len(usable)]
+
+    def replica_usable(self, replica):
+        """
+        Decides whether a replica is in sync with the primary server. The
+        result is cached for ``lag_check_interval`` seconds.
+        """
+        checked, usable = self.replica_status.get(replica, (0, False))
+        now = time.time()
+        if now - checked < self.lag_check_interval:
+            return usable
+        def info(host, port):
+            return redis.StrictRedis(
+                connection_pool=RedisConnectionPools.get(
+                    RedisConnectionData(host, port, self.default_db))) \
+                .info('replication')
+        try:
+            replica_info = info(*replica)
+            primary_info = info(self.host, self.port)
+            usable = replica_info.get('master_link_status') == 'up' and \
+                primary_info['master_repl_offset'] \
+                - replica_info.get('slave_repl_offset', 0) \
+                <= self.max_replica_lag
+        except redis.RedisError as ex:
+            log.warning('Cannot check replica %s:%s: %s',
+                        replica[0], replica[1], ex)
+            usable = False
+        if not usable:
+            log.debug('Replica %s:%s is lagging; using the primary server',
+                      *replica)
+        self.replica_status[replica] = (now, usable)
+        return usable
+
+    def transform_key(self, key, readonly=False):
+        """
+        Returns a connection and the actual key to be used for accessing the
+        given key.
+
+        :param bool readonly: Whether the key is only going to be read; in
+            which case the connection may point to a replica. Otherwise, the
+            key is assumed to be written.
+        """
+        if not readonly:
+            self.last_write = time.time()
+        tkey = DBSelectorKey(key, self, readonly)
         log.debug("Accessing key: %s", tkey)
         return tkey.get_connection()
 
@@ -128,7 +215,7 @@ class RedisKVStore(kvs.KeyValueStore):
 
     def query_item(self, key, default=None):
         log.debug('Querying %r', key)
-        backend, key = self.transform_key(key)
+        backend, key = self.transform_key(key, readonly=True)
         data = backend.get(key)
         retval = self.deserialize(data,Loader=yaml.Loader) if data else None
         return util.coalesce(retval, default)
@@ -140,17 +227,17 @@ class RedisKVStore(kvs.KeyValueStore):
 
     def _contains_key(self, key):
         log.debug('Checking %r', key)
-        backend, key = self.transform_key(key)
+        backend, key = self.transform_key(key, readonly=True)
         return backend.exists(key)
 
     def _enumerate(self, pattern, **kwargs):
         log.debug('Listing keys against pattern %r', pattern)
         if callable(pattern):
             import itertools as it
-            backend, _ = self.transform_key('')
+            backend, _ = self.transform_key('', readonly=True)
             return it.ifilter(pattern, list(backend.keys()))
         else:
-            backend, pattern = self.transform_key(pattern)
+            backend, pattern = self.transform_key(pattern, readonly=True)
             return [self.inverse_transform(backend, key)
                     for key in backend.keys(pattern)]
 
@@ -158,3 +245,95 @@ class RedisKVStore(kvs.KeyValueStore):
         log.debug('Deleting %r', key)
         backend, key = self.transform_key(key)
         backend.delete(key)
+
+def hash_tag(key):
+    """
+    Determines the part of a key that decides which shard stores the key.
+
+    If the key contains a non-empty ``{...}`` section, its content is the hash
+    tag (as in Redis Cluster). Otherwise, for infrastructure keys
+    (``infra:<user>@<infra_id>:...``) it is the ``infra:<user>@<infra_id>``
+    prefix, so all keys of an infrastructure are stored on the same shard.
+    For any other key, it is the key itself.
+    """
+    start = key.find('{')
+    if start >= 0:
+        end = key.find('}', start + 1)
+        if end > start + 1:
+            return key[start + 1:end]
+    parts = key.split(':', 2)
+    if parts[0] == 'infra' and len(parts) > 1:
+        return ':'.join(parts[:2])
+    return key
+
+def is_glob(pattern):
+    return any(c in pattern for c in '*?[\\')
+
+@factory.register(kvs.KeyValueStore, 'sharded-redis')
+class ShardedRedisKVStore(RedisKVStore):
+    """
+    Implementation of :class:`~occo.infobroker.kvstore.KeyValueStore`
+    distributing keys over multiple Redis servers by consistent hashing of
+    their :func:`hash_tag`.
+
+    All keys of an infrastructure are stored on the same shard, so hash and
+    pattern operations of the :class:`~occo.infobroker.uds.RedisUDS` on a
+    single infrastructure involve a single server. Patterns whose hash tag
+    is not fixed (e.g. listing all infrastructures) are evaluated on all
+    shards.
+
+    :param list shards: The servers to be used, each a :class:`dict` with
+        ``host`` and (optionally) ``port``.
+    :param int virtual_nodes: The number of points each shard has on the
+        hash ring.
+
+    Other parameters are the same as of :class:`RedisKVStore`.
+    """
+    def __init__(self, shards, virtual_nodes=160, **kwargs):
+        kwargs.pop('host', None)
+        kwargs.pop('port', None)
+        if kwargs.get('replicas'):
+            raise exc.ConfigurationError(
+                'Replicas are not supported with sharding', kwargs['replicas'])
+        super(ShardedRedisKVStore, self).__init__(host=None, port=None, **kwargs)
+        self.shards = [(s['host'], s.get('port', '6379')) for s in shards]
+        if not self.shards:
+            raise exc.ConfigurationError('No shards specified', shards)
+        if len(set(self.shards)) != len(self.shards):
+            raise exc.ConfigurationError('Duplicate shards specified', shards)
+        ring = sorted(
+            (self.ring_position('{0}:{1}#{2}'.format(host, port, i)), (host, port))
+            for host, port in self.shards
+            for i in range(virtual_nodes))
+        self.ring_positions = [pos for pos, _ in ring]
+        self.ring_shards = [shard for _, shard in ring]
+
+    @staticmethod
+    def ring_position(value):
+        return int(hashlib.md5(value.encode('utf-8')).hexdigest()[:16], 16)
+
+    def select_server(self, key, readonly=False):
+        i = bisect.bisect(self.ring_positions,
+                          self.ring_position(hash_tag(key)))
+        return self.ring_shards[i % len(self.ring_shards)]
+
+    def all_shards(self, db):
+        """
+        Returns a connection to each shard, using the given database.
+        """
+        return [redis.StrictRedis(connection_pool=RedisConnectionPools.get(
+                    RedisConnectionData(host, port, db)))
+                for host, port in self.shards]
+
+    def _enumerate(self, pattern, **kwargs):
+        if callable(pattern):
+            log.debug('Listing keys against pattern %r', pattern)
+            return [key for backend in self.all_shards(self.default_db)
+                    for key in backend.keys() if pattern(key)]
+        tkey = DBSelectorKey(pattern, self, readonly=True)
+        if not is_glob(hash_tag(tkey.key)):
+            return super(ShardedRedisKVStore, self)._enumerate(pattern, **kwargs)
+        log.debug('Listing keys against pattern %r on all shards', pattern)
+        return [self.inverse_transform(backend, key)
+                for backend in self.all_shards(tkey.db)
+                for key in backend.keys(tkey.key)]
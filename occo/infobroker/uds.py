@@ -34,6 +34,10 @@ from occo.infobroker.kvstore import KeyValueStore
 from occo.util import flatten
 from occo.util.config import yaml_load_file
 import logging, warnings
+import copy
+import os
+import hashlib
+import threading
 import time, datetime
 from occo.exceptions.orchestration import NoMatchingNodeDefinition
 import getpass
@@ -57,6 +61,145 @@ def ensure_exists(fun):
 
     return chk_result
 
+def freeze(obj):
+    """
+    Converts a structure of dicts and lists into a hashable equivalent.
+    """
+    if isinstance(obj, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in list(obj.items())))
+    if isinstance(obj, (list, tuple, set)):
+        return tuple(freeze(i) for i in obj)
+    return obj
+
+class NodeDefinitionIndex(object):
+    """
+    Inverted index over the ``resource`` section of a node type's
+    implementations.
+
+    Every hashable top-level attribute of the ``resource`` sections (e.g.
+    ``endpoint``, ``type``, ``region``) is indexed, so a filter only touches
+    the implementations matching its indexed attributes. Filter attributes
+    that cannot be indexed (unhashable values) are checked on the remaining
+    candidates.
+
+    :param list definitions: The implementations of a node type.
+    """
+    def __init__(self, definitions):
+        self.definitions = definitions
+        self.index = dict()
+        for position, definition in enumerate(definitions):
+            for attr, value in definition.get('resource', dict()).items():
+                try:
+                    self.index.setdefault(attr, dict()) \
+                        .setdefault(value, set()).add(position)
+                except TypeError:
+                    # Unhashable value; checked at query time instead.
+                    pass
+
+    def select(self, filter_keywords):
+        """
+        Returns the implementations whose ``resource`` section is a superset
+        of ``filter_keywords``, in their original order.
+        """
+        if not filter_keywords:
+            return list(self.definitions)
+
+        candidates = None
+        residual = dict()
+        # Intersect the most selective posting lists first
+        postings = list()
+        for attr, value in filter_keywords.items():
+            try:
+                postings.append(self.index.get(attr, dict()).get(value, set()))
+            except TypeError:
+                residual[attr] = value
+        for positions in sorted(postings, key=len):
+            candidates = positions if candidates is None \
+                else candidates & positions
+            if not candidates:
+                return list()
+
+        if candidates is None:
+            candidates = list(range(len(self.definitions)))
+        selected = (self.definitions[i] for i in sorted(candidates))
+        return [i for i in selected
+                if all(i.get('resource', dict()).get(k, object()) == v
+                       for k, v in residual.items())]
+
+class AuthDataMatcher(object):
+    """
+    Compiled form of an authorization data file.
+
+    The filters of each section are indexed on the filter field that
+    partitions them best, so a lookup only evaluates the filters whose value
+    of that field matches the instance data (plus the filters lacking it).
+
+    :param dict auth_data_sections: The content of the authorization data
+        file: ``section_name -> [filter]``, each filter being a :class:`dict`
+        with an ``auth_data`` item and the fields to be matched.
+    """
+    def __init__(self, auth_data_sections):
+        self.sections = dict(
+            (name, self.compile_section(filter_list))
+            for name, filter_list in list((auth_data_sections or dict()).items())
+            if filter_list)
+
+    @staticmethod
+    def compile_section(filter_list):
+        entries = [(dict((k, v) for k, v in list(f.items()) if k != 'auth_data'),
+                    f['auth_data'])
+                   for f in filter_list]
+
+        def hashable(value):
+            try:
+                hash(value)
+                return True
+            except TypeError:
+                return False
+
+        def cost(field):
+            # Expected number of filters evaluated when indexing on field
+            values = [f[field] for f, _ in entries
+                      if field in f and hashable(f[field])]
+            if not values:
+                return len(entries)
+            return (len(entries) - len(values)
+                    + float(len(values)) / len(set(values)))
+
+        fields = set(k for f, _ in entries for k in f)
+        field = min(sorted(fields), key=cost) if fields else None
+        index, unindexed = dict(), list()
+        for entry in entries:
+            f = entry[0]
+            if field in f and hashable(f[field]):
+                index.setdefault(f[field], list()).append(entry)
+            else:
+                unindexed.append(entry)
+        return field, index, unindexed, entries
+
+    def match(self, section_name, instance_data):
+        """
+        Returns the ``auth_data`` of the single filter in the given section
+        matching ``instance_data``; or :data:`None` if there is none.
+
+        :raises ValueError: if more than one filter matches.
+        """
+        if section_name not in self.sections:
+            return None
+        field, index, unindexed, entries = self.sections[section_name]
+        try:
+            candidates = index.get(instance_data[field], list()) + unindexed \
+                if field in instance_data else unindexed
+        except TypeError:
+            candidates = entries
+        selected_auth_data = [auth_data for f, auth_data in candidates
+                              if all(k in instance_data and instance_data[k] == v
+                                     for k, v in list(f.items()))]
+        if len(selected_auth_data) > 1:
+            raise ValueError('Cannot determine authorization information: auth_data filters result more than one possible authorization section!')
+        if len(selected_auth_data) < 1:
+            return None
+        return copy.deepcopy(selected_auth_data[0])
 
 @ib.provider
 class UDS(ib.InfoProvider, factory.MultiBackend):
@@ -68,6 +211,10 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
     """
     def __init__(self):
         self.ib = ib.main_info_broker
+        self.nodedef_cache = dict()
+        self.auth_data_cache = None
+        self.description_cache = dict()
+        self.description_lock = threading.Lock()
 
     def infra_key(self, infra_id):
         """
@@ -86,6 +233,16 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         """
         return 'infra:{0!s}@{1!s}:description'.format(getpass.getuser(),infra_id)
 
+    def infra_fields_key(self, infra_id):
+        """
+        Creates a backend key referencing the frequently accessed fields of a
+        specific infrastructure's static description (see
+        :meth:`description_fields`).
+
+        :param str infra_id: The internal key of the infrastructure.
+        """
+        return 'infra:{0!s}@{1!s}:fields'.format(getpass.getuser(),infra_id)
+
     def infra_state_key(self, infra_id):
         """
         Creates a backend key referencing a specific infrastructure's dynamic
@@ -177,6 +334,34 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         """
         return 'node_def:{0!s}@{1!s}'.format(getpass.getuser(),node_type)
 
+    def node_def_version_key(self, node_type):
+        """
+        Creates a backend key referencing the version of a node type's
+        definition. The version changes each time the definition is stored
+        through :meth:`set_node_definitions`.
+
+        :param str node_type: The identifier of the node's type (see
+            :ref:`nodedescription`\ /``type``.
+        """
+        return 'node_def:{0!s}@{1!s}:version'.format(getpass.getuser(),node_type)
+
+    def backend_stats_key(self, endpoint):
+        """
+        Creates a backend key referencing the provisioning statistics of a
+        backend.
+
+        :param str endpoint: The endpoint of the backend.
+        """
+        return 'backend_stats:{0!s}@{1!s}'.format(getpass.getuser(),endpoint)
+
+    def provisioning_key(self, node_id):
+        """
+        Creates a backend key referencing the start of a node's provisioning.
+
+        :param str node_id: The identifier of the node instance.
+        """
+        return 'provisioning:{0!s}@{1!s}'.format(getpass.getuser(),node_id)
+
     @ib.provides('node.definition.all')
     def all_nodedef(self, node_type):
         """
@@ -203,21 +388,102 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         return self.get_one_definition(
             node_type, filter_keywords, strategy, **kwargs)
 
+    def auth_data_matcher(self):
+        """
+        Returns the :class:`AuthDataMatcher` of the configured authorization
+        data file. The file is parsed again only if its path, modification
+        time or size has changed since it was last parsed.
+        """
+        path = ib.configured_auth_data_path
+        st = os.stat(path)
+        signature = (path, st.st_mtime, st.st_size)
+        cached = self.auth_data_cache
+        if cached and cached[0] == signature:
+            return cached[1]
+        log.debug('Loading authorization data file %r', path)
+        matcher = AuthDataMatcher(yaml_load_file(path))
+        self.auth_data_cache = (signature, matcher)
+        return matcher
+
     @ib.provides('backends.auth_data')
     def auth_data(self, section_name, instance_data):
-        filter_list = yaml_load_file(ib.configured_auth_data_path).get(section_name, None)
-        if not filter_list:
-            return None
-        selected_auth_data = []
-        for filter in filter_list:
-            auth_data = filter.pop('auth_data')
-            if self.is_subdict(filter, instance_data):
-                selected_auth_data.append(auth_data)
-        if len(selected_auth_data) > 1:
-            raise ValueError('Cannot determine authorization information: auth_data filters result more than one possible authorization section!')
-        if len(selected_auth_data) < 1:
-            return None
-        return selected_auth_data[0]
+        return self.auth_data_matcher().match(section_name, instance_data)
+
+    provisioning_stats_half_life = 6 * 3600
+    """
+    Half-life (in seconds) of the samples in the backend provisioning
+    statistics.
+    """
+
+    def record_provisioning_event(self, event_name, timestamp, event_data):
+        """
+        Updates the provisioning statistics of backends based on an
+        :class:`~occo.infobroker.eventlog.EventLog` event.
+
+        ``nodecreating`` events mark the start of provisioning a node;
+        a subsequent ``nodecreated`` or ``nodefailed`` event of the same node
+        is accounted as a success (with the elapsed time as latency) or a
+        failure of the backend. Other events are ignored.
+        """
+        if event_name == 'nodecreating':
+            self.kvstore.set_item(
+                self.provisioning_key(event_data['node_id']), timestamp)
+        elif event_name in ('nodecreated', 'nodefailed'):
+            key = self.provisioning_key(event_data['node_id'])
+            started = self.kvstore.query_item(key)
+            if started is None:
+                # Not a provisioning (e.g. a running node failed)
+                return
+            self.kvstore.delete_key(key)
+            self._update_backend_stats(
+                event_data['endpoint'], timestamp,
+                failed=(event_name == 'nodefailed'),
+                latency=timestamp - started)
+
+    def _update_backend_stats(self, endpoint, timestamp, failed, latency):
+        """
+        Adds a sample to the exponentially decayed statistics of a backend.
+        """
+        key = self.backend_stats_key(endpoint)
+        stats = self.kvstore.query_item(key) or dict(
+            weight=0.0, failures=0.0, latency_weight=0.0, latency_sum=0.0,
+            updated=timestamp)
+        decay = 0.5 ** (max(timestamp - stats['updated'], 0)
+                        / float(self.provisioning_stats_half_life))
+        stats['weight'] = stats['weight'] * decay + 1
+        stats['failures'] = stats['failures'] * decay + (1 if failed else 0)
+        stats['latency_weight'] *= decay
+        stats['latency_sum'] *= decay
+        if not failed:
+            stats['latency_weight'] += 1
+            stats['latency_sum'] += latency
+        stats['updated'] = timestamp
+        log.debug('Updating provisioning statistics of %r: %r',
+                  endpoint, stats)
+        self.kvstore.set_item(key, stats)
+
+    @ib.provides('backends.provisioning_stats')
+    def get_backend_stats(self, endpoints):
+        """
+        .. ibkey::
+            Queries the observed provisioning statistics of backends.
+
+            :param list endpoints: The endpoints of the backends.
+            :returns: (``endpoint -> stats``) For each backend either
+                :data:`None` if there are no observations, or a :class:`dict`
+                with its ``latency`` (average seconds of successful
+                provisioning, or :data:`None`), ``failure_rate`` (0..1) and
+                ``updated`` (timestamp of the last sample).
+        """
+        result = dict()
+        for endpoint in endpoints:
+            stats = self.kvstore.query_item(self.backend_stats_key(endpoint))
+            result[endpoint] = None if not stats else dict(
+                latency=(stats['latency_sum'] / stats['latency_weight']
+                         if stats['latency_weight'] else None),
+                failure_rate=stats['failures'] / stats['weight'],
+                updated=stats['updated'])
+        return result
 
     @ib.provides('infrastructure.static_description')
     @ensure_exists
@@ -229,8 +495,65 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
 
             :param str infra_id: The identifier of the infrastructure.
         """
-        return self.kvstore.query_item(
-            self.infra_description_key(infra_id))
+        return self._load_static_description(infra_id)[1]
+
+    @ib.provides('infrastructure.static_description.version')
+    def get_static_description_version(self, infra_id):
+        """
+        .. ibkey::
+             Queries the version of an infrastructure's static description.
+             The version is increased each time the description (including
+             its suspended state) is modified.
+
+            :param str infra_id: The identifier of the infrastructure.
+            :returns: The version, or :data:`None` if it is unknown.
+        """
+        return self.get_description_fields(infra_id, 'version')['version']
+
+    @ib.provides('infrastructure.static_description.if_modified')
+    def get_static_description_if_modified(self, infra_id, known_version):
+        """
+        .. ibkey::
+             Conditionally queries an infrastructure's static description.
+
+            :param str infra_id: The identifier of the infrastructure.
+            :param known_version: The version of the description already
+                known by the caller.
+            :returns: ``(version, static_description)``, where
+                ``static_description`` is :data:`None` if ``version`` is
+                ``known_version``.
+        """
+        version = self.get_static_description_version(infra_id)
+        if version is not None and version == known_version:
+            return version, None
+        version, sd = self._load_static_description(infra_id)
+        if sd is None:
+            raise exc.KeyNotFoundError('Unknown infrastructure', infra_id)
+        return version, sd
+
+    def _load_static_description(self, infra_id):
+        """
+        Returns the version and the static description of an
+        infrastructure.
+
+        Deserialized descriptions are cached by version, so while the
+        description is unmodified only its fields are queried.
+        """
+        fields = self.get_description_fields(infra_id, 'version', 'suspended')
+        version = fields['version']
+        cached = self.description_cache.get(infra_id)
+        if version is not None and cached and cached[0] == version:
+            sd = copy.deepcopy(cached[1])
+        else:
+            sd = self.kvstore.query_item(
+                self.infra_description_key(infra_id))
+            if sd is None:
+                return version, None
+            if version is not None:
+                self.description_cache[infra_id] = (version, copy.deepcopy(sd))
+        if fields['suspended'] is not None:
+            sd.suspended = fields['suspended']
+        return version, sd
 
     @ib.provides('infrastructure.finished_first_maintenance')
     def get_first_maint(self, infra_id):
@@ -245,7 +568,69 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
 
             :param str infra_id: The identifier of the infrastructure.
         """
-        return self.get_static_description(infra_id).name
+        name = self.get_description_fields(infra_id, 'name')['name']
+        if name is None:
+            # Stored before description fields were introduced
+            name = self.get_static_description(infra_id).name
+        return name
+
+    def description_fields(self, static_description):
+        """
+        Extracts the frequently accessed fields of a static description.
+        These are stored separately from the description itself, so they can
+        be read and written without (de)serializing the whole description.
+
+        The :attr:`suspended` field is authoritative: it is overlaid on the
+        stored description when it is queried.
+        """
+        return dict(
+            name=static_description.name,
+            suspended=bool(getattr(static_description, 'suspended', False)),
+            userinfo_strategy=static_description.userinfo_strategy,
+            nodes_digest=hashlib.sha1(
+                yaml.dump(static_description.nodes).encode('utf-8')
+            ).hexdigest())
+
+    def get_description_fields(self, infra_id, *fields):
+        """
+        Returns the given fields of an infrastructure's static description
+        (see :meth:`description_fields`). Missing fields are :data:`None`.
+        """
+        stored = self.kvstore.query_item(self.infra_fields_key(infra_id)) \
+            or dict()
+        return dict((f, stored.get(f)) for f in fields)
+
+    def set_description_field(self, infra_id, field, value):
+        """
+        Sets a single field of an infrastructure's static description (see
+        :meth:`description_fields`), and increases the version of the
+        description.
+        """
+        key = self.infra_fields_key(infra_id)
+        with self.description_lock:
+            stored = self.kvstore.query_item(key)
+            if stored is None:
+                stored = self.description_fields(
+                    self.get_static_description(infra_id))
+            stored[field] = value
+            stored['version'] = stored.get('version', 0) + 1
+            self.kvstore.set_item(key, stored)
+
+    def store_static_description(self, static_description):
+        """
+        Stores a static description along with its fields (see
+        :meth:`description_fields`), and increases its version.
+        """
+        infra_id = static_description.infra_id
+        key = self.infra_fields_key(infra_id)
+        fields = self.description_fields(static_description)
+        with self.description_lock:
+            self.kvstore.set_item(
+                self.infra_description_key(infra_id),
+                static_description)
+            stored = self.kvstore.query_item(key) or dict()
+            fields['version'] = stored.get('version', 0) + 1
+            self.kvstore.set_item(key, fields)
 
     @ib.provides('infrastructure.node_instances')
     @ensure_exists
@@ -354,47 +739,106 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         nodes = self._filtered_infra(infra_id, name)
         return self._filter_by_nodeid(nodes, node_id)
 
+    config_manager_resolution_threads = 8
+    """
+    Maximum number of threads used to resolve the node definitions of an
+    infrastructure in :meth:`get_config_mangager_list`. Resolution is
+    sequential if there are no more distinct node definitions than this.
+    """
+
     @ib.provides('config_managers')
     def get_config_mangager_list(self, infra_id):
         sd = self.get_static_description(infra_id)
-        cmlist=[]
+
+        # Nodes sharing type, filter and strategy are resolved only once
+        requests = dict()
         for node in sd.nodes:
-            nd = self.ib.get('node.definition',
-                        node['type'],
-                        filter_keywords = node.get('resource_filter'),
-                        strategy=node.get('backend_selection_strategy', 'random'))
-            scinfo={}
-            if (not 'config_management' in nd) or (not 'type' in nd['config_management']):
-                type = 'dummy'
-            else:
-                type = nd['config_management']['type']
-            if (not 'config_management' in nd) or (not 'endpoint' in nd['config_management']):
-                endpoint = 'null'
-            else:
-                endpoint = nd['config_management']['endpoint']
-            found = False
-            for cm in cmlist:
-                if cm['type'] == type and cm['endpoint'] == endpoint:
-                    found = True
-            if not found:
-                cminfo=nd.get('config_management',dict())
-                cminfo['type']=type
-                cminfo['endpoint']=endpoint
-                cmlist.append(cminfo)
-        return cmlist
+            strategy = node.get('backend_selection_strategy', 'random')
+            request = (node['type'], node.get('resource_filter'), strategy)
+            requests.setdefault(
+                (request[0], freeze(request[1]), strategy), request)
+
+        def resolve(request):
+            node_type, resource_filter, strategy = request
+            return self.ib.get('node.definition',
+                               node_type,
+                               filter_keywords=resource_filter,
+                               strategy=strategy)
+
+        requests = list(requests.values())
+        if len(requests) > self.config_manager_resolution_threads:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(
+                    self.config_manager_resolution_threads) as executor:
+                definitions = list(executor.map(resolve, requests))
+        else:
+            definitions = [resolve(i) for i in requests]
+
+        cms = dict()
+        for nd in definitions:
+            cminfo = dict(nd.get('config_management', dict()))
+            cminfo.setdefault('type', 'dummy')
+            cminfo.setdefault('endpoint', 'null')
+            cms.setdefault((cminfo['type'], cminfo['endpoint']), cminfo)
+        return list(cms.values())
 
     def is_subdict(self,subdict=dict(),maindict=dict()):
         return all((k in maindict and maindict[k]==v)\
                     for k,v in list(subdict.items()))
 
-    def get_filtered_definition_list(self, node_type,
-                                     filter_keywords=dict()):
+    def set_node_definitions(self, node_type, definitions):
+        """
+        Stores the implementations of a node type, and bumps its version so
+        cached indexes of the previous implementations are invalidated.
+
+        :param str node_type: The identifier of the node's type.
+        :param list definitions: The implementations of the node type.
+        """
+        log.debug('Storing %d definitions for %r', len(definitions), node_type)
+        version_key = self.node_def_version_key(node_type)
+        version = self.kvstore.query_item(version_key, 0)
+        self.kvstore.set_item(self.node_def_key(node_type), definitions)
+        self.kvstore.set_item(version_key, version + 1)
+
+    def _definition_index(self, node_type):
+        """
+        Returns the :class:`NodeDefinitionIndex` of a node type, or
+        :data:`None` if the definitions have been stored without a version
+        (i.e. not through :meth:`set_node_definitions`), in which case they
+        cannot be cached.
+
+        The index is cached by node type and version; only the version is
+        queried when the cached index is still valid.
+        """
+        version = self.kvstore.query_item(self.node_def_version_key(node_type))
+        if version is None:
+            return None
+        cached = self.nodedef_cache.get(node_type)
+        if cached and cached[0] == version:
+            return cached[1]
+        index = NodeDefinitionIndex(self.all_nodedef(node_type))
+        self.nodedef_cache[node_type] = (version, index)
+        return index
+
+    def _select_definitions(self, node_type, filter_keywords=dict()):
+        """
+        Returns the implementations matching the filter. The result may
+        share objects with the definition cache, so it must not be modified.
+        """
+        index = self._definition_index(node_type)
+        if index is not None:
+            return index.select(filter_keywords)
         all_definitions = self.all_nodedef(node_type)
         if filter_keywords:
             all_definitions = (i for i in all_definitions
                                if self.is_subdict(filter_keywords,i['resource']))
         return list(all_definitions)
 
+    def get_filtered_definition_list(self, node_type,
+                                     filter_keywords=dict()):
+        return copy.deepcopy(
+            self._select_definitions(node_type, filter_keywords))
+
     def get_one_definition(self, node_type, filter_keywords=dict(),
                            strategy='random', **kwargs):
         """
@@ -404,14 +848,14 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         log.debug('Selecting a node definition for %r (filter: %r) '
                   'using strategy %r',
                   node_type, filter_keywords, strategy)
-        all_definitions = self.get_filtered_definition_list(
+        all_definitions = self._select_definitions(
             node_type, filter_keywords)
         if not all_definitions:
             raise NoMatchingNodeDefinition(None, filter_keywords, node_type)
 
         selector = NodeDefinitionSelector.instantiate(
             protocol=strategy, **kwargs)
-        return selector.select_definition(all_definitions)
+        return copy.deepcopy(selector.select_definition(all_definitions))
 
     def add_infrastructure(self, static_description):
         """
@@ -450,9 +894,7 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         """
         log.debug('Suspending infrastructure %r (reason: %r)',
                   infra_id, reason)
-        sd = self.get_static_description(infra_id)
-        sd.suspended = True
-        self.update_infrastructure(sd)
+        self.set_description_field(infra_id, 'suspended', True)
 
     def resume_infrastructure(self, infra_id):
         """
@@ -461,9 +903,7 @@ class UDS(ib.InfoProvider, factory.MultiBackend):
         :param str infra_id: The identifier of the infrastructure.
         """
         log.debug('Resuming infrastructure %r', infra_id)
-        sd = self.get_static_description(infra_id)
-        sd.suspended = False
-        self.update_infrastructure(sd)
+        self.set_description_field(infra_id, 'suspended', False)
 
     def set_infrastructure_notification(self, infra_id, notification):
         """
@@ -527,9 +967,7 @@ class DictUDS(UDS):
         store backend.
         """
         log.debug('Adding infrastructure: %r', static_description.infra_id)
-        self.kvstore.set_item(
-            self.infra_description_key(static_description.infra_id),
-            static_description)
+        self.store_static_description(static_description)
 
     def update_infrastructure(self, static_description):
         """
@@ -537,9 +975,7 @@ class DictUDS(UDS):
         store backend.
         """
         log.debug('Updating infrastructure: %r', static_description.infra_id)
-        self.kvstore.set_item(
-            self.infra_description_key(static_description.infra_id),
-            static_description)
+        self.store_static_description(static_description)
 
     def remove_infrastructure(self, infra_id):
         """
@@ -613,7 +1049,8 @@ class RedisUDS(UDS):
 
     def _load_infra_state(self, infra_id):
         node_state_pattern = self.node_state_key(infra_id, "*")
-        backend, pattern = self.kvstore.transform_key(node_state_pattern)
+        backend, pattern = self.kvstore.transform_key(node_state_pattern,
+                                                      readonly=True)
         infra_state = dict()
         for key in backend.keys(pattern):
             node_name = key.split(':')[-1]
@@ -629,9 +1066,7 @@ class RedisUDS(UDS):
         store backend.
         """
         log.debug('Adding infrastructure: %r', static_description.infra_id)
-        self.kvstore.set_item(
-            self.infra_description_key(static_description.infra_id),
-            static_description)
+        self.store_static_description(static_description)
 
     def update_infrastructure(self, static_description):
         """
@@ -639,9 +1074,7 @@ class RedisUDS(UDS):
         store backend.
         """
         log.debug('Updating infrastructure: %r', static_description.infra_id)
-        self.kvstore.set_item(
-            self.infra_description_key(static_description.infra_id),
-            static_description)
+        self.store_static_description(static_description)
 
     def remove_infrastructure(self, infra_id):
         """
@@ -649,11 +1082,63 @@ class RedisUDS(UDS):
         store backend.
         """
         log.debug('Removing infrastructure: %r', infra_id)
+        self.description_cache.pop(infra_id, None)
         pattern = '{0}*'.format(self.infra_key(infra_id))
         keys = self.kvstore.enumerate(pattern)
         for keytodelete in keys:
             self.kvstore.delete_key(keytodelete)
 
+    def get_description_fields(self, infra_id, *fields):
+        """
+        Returns the given fields of an infrastructure's static description
+        using a single ``HMGET``.
+        """
+        backend, key = self.kvstore.transform_key(
+            self.infra_fields_key(infra_id), readonly=True)
+        values = backend.hmget(key, fields) if fields else []
+        return dict(
+            (f, self.kvstore.deserialize(v, Loader=yaml.Loader)
+                if v is not None else None)
+            for f, v in zip(fields, values))
+
+    def set_description_field(self, infra_id, field, value):
+        """
+        Sets a single field of an infrastructure's static description, and
+        increases the version of the description, in a single transaction.
+        """
+        backend, key = self.kvstore.transform_key(
+            self.infra_fields_key(infra_id))
+        if not backend.exists(key):
+            self._store_description_fields(
+                infra_id, self.description_fields(
+                    self.get_static_description(infra_id)))
+        pipe = backend.pipeline()
+        pipe.hset(key, field, self.kvstore.serialize(value))
+        pipe.hincrby(key, 'version', 1)
+        pipe.execute()
+
+    def _store_description_fields(self, infra_id, fields):
+        backend, key = self.kvstore.transform_key(
+            self.infra_fields_key(infra_id))
+        pipe = backend.pipeline()
+        for field, value in list(fields.items()):
+            pipe.hset(key, field, self.kvstore.serialize(value))
+        pipe.hincrby(key, 'version', 1)
+        pipe.execute()
+
+    def store_static_description(self, static_description):
+        """
+        Stores a static description along with its fields (see
+        :meth:`~UDS.description_fields`). The version of the description is
+        increased after the description has been stored.
+        """
+        infra_id = static_description.infra_id
+        self.kvstore.set_item(
+            self.infra_description_key(infra_id),
+            static_description)
+        self._store_description_fields(
+            infra_id, self.description_fields(static_description))
+
     def register_started_node(self, infra_id, node_name, instance_data):
         """
         Registers a started node instance in an infrastructure's dynamic
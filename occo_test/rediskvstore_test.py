@@ -89,3 +89,80 @@ class RKVSTest(unittest.TestCase):
         self.store.set_item('alma', 'korte')
         self.store.delete_key('alma')
         self.assertEqual(self.store.query_item('alma'), None)
+
+class ShardedRKVSTest(unittest.TestCase):
+    def setUp(self):
+        self.store = kvs.KeyValueStore.instantiate(
+            protocol='sharded-redis',
+            shards=[dict(host='shard-{0}'.format(i)) for i in range(4)],
+            altdbs=dict(alt=15))
+    def test_hash_tag(self):
+        self.assertEqual(rkvs.hash_tag('infra:u@1234:state:node'), 'infra:u@1234')
+        self.assertEqual(rkvs.hash_tag('infra:u@1234'), 'infra:u@1234')
+        self.assertEqual(rkvs.hash_tag('node_def:u@type'), 'node_def:u@type')
+        self.assertEqual(rkvs.hash_tag('x{tag}y'), 'tag')
+    def test_colocation(self):
+        servers = set(self.store.select_server(k) for k in [
+            'infra:u@1234', 'infra:u@1234:description',
+            'infra:u@1234:state:node', 'infra:u@1234:fields'])
+        self.assertEqual(len(servers), 1)
+        k = rkvs.DBSelectorKey('alt:infra:u@1234:state', self.store)
+        self.assertEqual(k.db, 15)
+        self.assertEqual((k.rcd.host, k.rcd.port), servers.pop())
+    def test_distribution(self):
+        servers = [self.store.select_server('infra:u@{0}'.format(i))
+                   for i in range(1000)]
+        for shard in self.store.shards:
+            self.assertGreater(servers.count(shard), 100)
+    def test_consistency(self):
+        grown = kvs.KeyValueStore.instantiate(
+            protocol='sharded-redis',
+            shards=[dict(host='shard-{0}'.format(i)) for i in range(5)])
+        keys = ['infra:u@{0}'.format(i) for i in range(1000)]
+        moved = [k for k in keys
+                 if self.store.select_server(k) != grown.select_server(k)]
+        self.assertTrue(all(grown.select_server(k) == ('shard-4', '6379')
+                            for k in moved))
+        self.assertLess(len(moved), 400)
+    def test_config_error(self):
+        from occo.exceptions import ConfigurationError
+        with self.assertRaises(ConfigurationError):
+            kvs.KeyValueStore.instantiate(
+                protocol='sharded-redis',
+                shards=[dict(host='a'), dict(host='a')])
+
+class ReplicaRKVSTest(unittest.TestCase):
+    def setUp(self):
+        with open(util.rel_to_file("rediskvstore_demo.yaml"), 'r') as stream:
+            self.data=yaml.load(stream)
+        self.data['replicas'] = [dict(host='replica-1'), dict(host='replica-2')]
+        self.data['read_your_writes_window'] = 60
+        self.store = kvs.KeyValueStore.instantiate(**self.data)
+        self.primary = (self.store.host, self.store.port)
+    def test_routing(self):
+        self.store.replica_usable = lambda replica: True
+        self.assertEqual(self.store.select_server('x'), self.primary)
+        self.assertEqual(
+            set(self.store.select_server('x', readonly=True) for i in range(4)),
+            set([('replica-1', '6379'), ('replica-2', '6379')]))
+    def test_read_your_writes(self):
+        self.store.replica_usable = lambda replica: True
+        self.store.set_item('alma', 'korte')
+        self.assertEqual(self.store.select_server('alma', readonly=True),
+                         self.primary)
+        self.store.last_write -= 60
+        self.assertNotEqual(self.store.select_server('alma', readonly=True),
+                            self.primary)
+    def test_lagging(self):
+        self.store.replica_usable = lambda replica: replica[0] == 'replica-2'
+        self.assertEqual(self.store.select_server('x', readonly=True),
+                         ('replica-2', '6379'))
+        self.store.replica_usable = lambda replica: False
+        self.assertEqual(self.store.select_server('x', readonly=True),
+                         self.primary)
+    def test_unreachable_replica(self):
+        self.store.replicas = [('localhost', '1')]
+        self.assertFalse(self.store.replica_usable(('localhost', '1')))
+        self.store.set_item('alma', 'korte')
+        self.store.last_write -= 60
+        self.assertEqual(self.store.query_item('alma'), 'korte')
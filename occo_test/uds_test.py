@@ -15,12 +15,15 @@ import occo.infobroker.rediskvstore as rkvs
 import occo.infobroker.kvstore as kvs
 import occo.infobroker as ib
 from occo.infobroker.uds import UDS
+from occo.infobroker.brokering import NodeDefinitionSelector
 import redis
 import yaml
 import occo.util as util
 import unittest
+import os
 from occo.compiler import StaticDescription
 from occo.exceptions import ConfigurationError
+from occo.exceptions.orchestration import NoMatchingNodeDefinition
 
 class DictUDSTest(unittest.TestCase):
     def setUp(self):
@@ -75,8 +78,220 @@ class DictUDSTest(unittest.TestCase):
         self.assertTrue(uds.get_static_description(infraid).suspended)
         uds.resume_infrastructure(infraid)
         self.assertFalse(uds.get_static_description(infraid).suspended)
+    def test_description_fields(self):
+        sd = StaticDescription(dict(name='fieldtest',
+                                    nodes=[],
+                                    user_id=None))
+        infraid = sd.infra_id
+        uds = UDS.instantiate(self.protocol, **self.config)
+        uds.add_infrastructure(sd)
+        self.assertEqual(uds.infra_name(infraid), 'fieldtest')
+        uds.suspend_infrastructure(infraid, reason=None)
+        # Only the field is written, not the description
+        stored = uds.kvstore.query_item(uds.infra_description_key(infraid))
+        self.assertFalse(stored.suspended)
+        self.assertEqual(uds.get_description_fields(infraid, 'suspended'),
+                         dict(suspended=True))
+        self.assertTrue(uds.get_static_description(infraid).suspended)
+        # Descriptions stored without fields
+        uds.kvstore.delete_key(uds.infra_fields_key(infraid))
+        self.assertEqual(uds.infra_name(infraid), 'fieldtest')
+        uds.resume_infrastructure(infraid)
+        self.assertEqual(uds.get_description_fields(infraid, 'name'),
+                         dict(name='fieldtest'))
+    def test_description_version(self):
+        sd = StaticDescription(dict(name='versiontest',
+                                    nodes=[],
+                                    user_id=None))
+        infraid = sd.infra_id
+        uds = UDS.instantiate(self.protocol, **self.config)
+        uds.add_infrastructure(sd)
+        v1 = uds.get_static_description_version(infraid)
+        self.assertEqual(uds.get_static_description_if_modified(infraid, v1),
+                         (v1, None))
+        uds.get_static_description(infraid).name = 'modified'
+        self.assertEqual(uds.get_static_description(infraid).name,
+                         'versiontest')
+        uds.suspend_infrastructure(infraid, reason=None)
+        v2, sd2 = uds.get_static_description_if_modified(infraid, v1)
+        self.assertGreater(v2, v1)
+        self.assertTrue(sd2.suspended)
+        sd2.name = 'renamed'
+        uds.update_infrastructure(sd2)
+        self.assertGreater(uds.get_static_description_version(infraid), v2)
+        self.assertEqual(uds.get_static_description(infraid).name, 'renamed')
 
 class RedisUDSTest(DictUDSTest):
     def init(self):
         self.protocol = 'redis'
         self.config = dict()
+
+class NodeDefinitionTest(unittest.TestCase):
+    def setUp(self):
+        import uuid
+        self.node_type = 'unittest-type-{0}'.format(uuid.uuid4())
+        self.uds = UDS.instantiate('dict')
+        self.definitions = [
+            dict(name='a', resource=dict(type='ec2', endpoint='e1', region='r1')),
+            dict(name='b', resource=dict(type='ec2', endpoint='e2', region='r1')),
+            dict(name='c', resource=dict(type='nova', endpoint='e3',
+                                         flavors=['small', 'large'])),
+        ]
+    def names(self, definitions):
+        return [i['name'] for i in definitions]
+    def test_filter(self):
+        self.uds.set_node_definitions(self.node_type, self.definitions)
+        flist = self.uds.get_filtered_definition_list
+        self.assertEqual(self.names(flist(self.node_type)), ['a', 'b', 'c'])
+        self.assertEqual(self.names(flist(self.node_type, dict(region='r1'))),
+                         ['a', 'b'])
+        self.assertEqual(
+            self.names(flist(self.node_type, dict(type='ec2', endpoint='e2'))),
+            ['b'])
+        self.assertEqual(
+            self.names(flist(self.node_type, dict(flavors=['small', 'large']))),
+            ['c'])
+        self.assertEqual(flist(self.node_type, dict(type='ec2', endpoint='e3')),
+                         [])
+    def test_unversioned(self):
+        self.uds.kvstore.set_item(self.uds.node_def_key(self.node_type),
+                                  self.definitions)
+        self.assertEqual(
+            self.names(self.uds.get_filtered_definition_list(
+                self.node_type, dict(type='ec2'))),
+            ['a', 'b'])
+    def test_cache_invalidation(self):
+        self.uds.set_node_definitions(self.node_type, self.definitions)
+        nd = self.uds.get_one_definition(self.node_type, dict(endpoint='e3'))
+        self.assertEqual(nd['name'], 'c')
+        nd['resource']['endpoint'] = 'modified'
+        self.assertEqual(
+            self.uds.get_one_definition(self.node_type,
+                                        dict(endpoint='e3'))['name'], 'c')
+        self.uds.set_node_definitions(self.node_type, self.definitions[:2])
+        with self.assertRaises(NoMatchingNodeDefinition):
+            self.uds.get_one_definition(self.node_type, dict(endpoint='e3'))
+
+class FastestSelectorTest(unittest.TestCase):
+    def setUp(self):
+        import uuid
+        self.uds = ib.real_main_info_broker = UDS.instantiate('dict')
+        self.endpoints = ['ep-{0}-{1}'.format(i, uuid.uuid4()) for i in range(3)]
+        self.definitions = [dict(name=i, resource=dict(endpoint=i))
+                            for i in self.endpoints]
+    def provision(self, endpoint, node_id, start, end, event='nodecreated'):
+        self.uds.record_provisioning_event(
+            'nodecreating', start, dict(node_id=node_id))
+        self.uds.record_provisioning_event(
+            event, end, dict(node_id=node_id, endpoint=endpoint))
+    def select(self):
+        selector = NodeDefinitionSelector.instantiate(protocol='fastest')
+        return selector.select_definition(self.definitions)['name']
+    def test_stats(self):
+        fast, slow, failing = self.endpoints
+        self.provision(fast, 'n1', 0, 10)
+        self.provision(fast, 'n3', 10, 40)
+        self.provision(failing, 'n4', 0, 5, 'nodefailed')
+        self.uds.record_provisioning_event(
+            'nodefailed', 100, dict(node_id='running', endpoint=slow))
+        stats = self.uds.get_backend_stats(self.endpoints)
+        self.assertAlmostEqual(stats[fast]['latency'], 20, places=2)
+        self.assertEqual(stats[fast]['failure_rate'], 0)
+        self.assertIsNone(stats[slow])
+        self.assertIsNone(stats[failing]['latency'])
+        self.assertEqual(stats[failing]['failure_rate'], 1)
+    def test_select(self):
+        fast, slow, failing = self.endpoints
+        self.assertIn(self.select(), self.endpoints)
+        self.provision(fast, 'n1', 0, 10)
+        self.provision(slow, 'n2', 0, 100)
+        self.provision(failing, 'n3', 0, 5, 'nodefailed')
+        self.assertEqual(self.select(), fast)
+        for i in range(19):
+            self.provision(fast, 'f{0}'.format(i), 0, 10, 'nodefailed')
+        self.assertEqual(self.select(), slow)
+
+class AuthDataTest(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        self.uds = UDS.instantiate('dict')
+        fd, self.path = tempfile.mkstemp(suffix='.yaml')
+        os.close(fd)
+        self.write("""
+            resource:
+                - type: ec2
+                  endpoint: e1
+                  auth_data: {user: u1}
+                - type: ec2
+                  endpoint: e2
+                  auth_data: {user: u2}
+                - type: nova
+                  auth_data: {user: u3}
+                - type: nova
+                  regions: [r1, r2]
+                  auth_data: {user: u4}
+            """)
+        self.orig_path = ib.configured_auth_data_path
+        ib.configured_auth_data_path = self.path
+    def tearDown(self):
+        ib.configured_auth_data_path = self.orig_path
+        os.remove(self.path)
+    def write(self, content):
+        import textwrap
+        with open(self.path, 'w') as f:
+            f.write(textwrap.dedent(content))
+    def test_match(self):
+        get = self.uds.auth_data
+        self.assertEqual(get('resource', dict(type='ec2', endpoint='e2')),
+                         dict(user='u2'))
+        self.assertEqual(get('resource', dict(type='nova', endpoint='e2')),
+                         dict(user='u3'))
+        self.assertIsNone(get('resource', dict(type='ec2', endpoint='e3')))
+        self.assertIsNone(get('config_manager', dict(type='ec2')))
+        with self.assertRaises(ValueError):
+            get('resource', dict(type='nova', regions=['r1', 'r2']))
+    def test_no_mutation(self):
+        get = self.uds.auth_data
+        get('resource', dict(type='ec2', endpoint='e1'))['user'] = 'modified'
+        self.assertEqual(get('resource', dict(type='ec2', endpoint='e1')),
+                         dict(user='u1'))
+    def test_reload(self):
+        self.assertEqual(self.uds.auth_data('resource', dict(type='ec2', endpoint='e1')),
+                         dict(user='u1'))
+        self.write("""
+            resource:
+                - endpoint: e1
+                  auth_data: {user: changed}
+            """)
+        os.utime(self.path, (0, 0))
+        self.assertEqual(self.uds.auth_data('resource', dict(type='ec2', endpoint='e1')),
+                         dict(user='changed'))
+
+class ConfigManagerListTest(unittest.TestCase):
+    def test_config_managers(self):
+        import uuid
+        uds = ib.real_main_info_broker = UDS.instantiate('dict')
+        t1, t2 = ['unittest-type-{0}'.format(uuid.uuid4()) for i in range(2)]
+        uds.set_node_definitions(t1, [
+            dict(resource=dict(endpoint='e1'),
+                 config_management=dict(type='chef', endpoint='c1')),
+            dict(resource=dict(endpoint='e2'),
+                 config_management=dict(type='chef', endpoint='c1')),
+        ])
+        uds.set_node_definitions(t2, [dict(resource=dict(endpoint='e1'))])
+        sd = StaticDescription(dict(
+            name='cmtest', user_id=None,
+            nodes=[dict(name='n{0}'.format(i), type=t1,
+                        resource_filter=dict(endpoint='e{0}'.format(i % 2 + 1)))
+                   for i in range(10)] + [dict(name='x', type=t2)]))
+        uds.add_infrastructure(sd)
+        queries = []
+        orig_get = uds.get
+        def get(key, *args, **kwargs):
+            queries.append(key)
+            return orig_get(key, *args, **kwargs)
+        uds.get = get
+        cms = uds.get_config_mangager_list(sd.infra_id)
+        self.assertEqual(queries.count('node.definition'), 3)
+        self.assertEqual(sorted((i['type'], i['endpoint']) for i in cms),
+                         [('chef', 'c1'), ('dummy', 'null')])